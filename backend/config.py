@@ -1,13 +1,35 @@
 """Configuration loader for external services."""
+import hashlib
+import json
 import os
+import re
 from pathlib import Path
 from typing import Any
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 load_dotenv()
 
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+?)\}")
+
+SERVICE_TYPES = ("plagiarism_checkers", "ai_detectors", "rephrasing")
+
+# Request timeout for services that don't set their own timeout_s
+DEFAULT_SERVICE_TIMEOUT = 10.0
+
+# OpenAI rewrites of long texts are slow, so keep the OpenAI client's default
+DEFAULT_OPENAI_TIMEOUT = 600.0
+
+# Parsed configs keyed by path, invalidated when the file's mtime changes
+_CONFIG_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+
 
 def load_config(config_path: str | None = None) -> dict[str, Any]:
     """Load configuration from YAML file.
@@ -17,33 +39,60 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
     
     Returns:
         Configuration dictionary with environment variable substitution.
+        The parsed result is cached and only reloaded when the file changes,
+        so callers must treat it as read-only.
     """
     if config_path is None:
         config_path = os.getenv("CONFIG_PATH", "config/services.yaml")
     
     config_file = Path(config_path)
-    if not config_file.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        mtime = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    with open(config_file, "r") as f:
-        config = yaml.safe_load(f)
+    cache_key = str(config_file)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    raw = config_file.read_bytes()
+    config = yaml.load(raw, Loader=_YamlLoader)
     
     # Substitute environment variables
     config = _substitute_env_vars(config)
     
+    # Identifies this config version consistently across worker processes.
+    # Hashed after substitution so changing a referenced env var, such as
+    # an API key, also changes the version.
+    resolved = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    config["_version"] = hashlib.blake2b(resolved, digest_size=8).hexdigest()
+    
+    # Precompute request headers for every configured service
+    for services in (config.get("services") or {}).values():
+        for service in services or []:
+            service["_headers"] = _build_headers(service)
+    
+    # Precompute enabled services once per config version
+    config["_enabled"] = {
+        service_type: _filter_enabled(config, service_type)
+        for service_type in SERVICE_TYPES
+    }
+    
+    _CONFIG_CACHE[cache_key] = (mtime, config)
     return config
 
 
 def _substitute_env_vars(obj: Any) -> Any:
     """Recursively substitute environment variables in config values.
     
-    Supports ${VAR_NAME} syntax for environment variable substitution.
+    Supports ${VAR_NAME} syntax for environment variable substitution,
+    anywhere within a string value. Unset variables become empty strings.
     """
     if isinstance(obj, str):
-        if obj.startswith("${") and obj.endswith("}"):
-            env_var = obj[2:-1]
-            return os.getenv(env_var, "")
-        return obj
+        if "${" not in obj:
+            return obj
+        return _ENV_VAR_PATTERN.sub(lambda m: os.getenv(m.group(1), ""), obj)
     elif isinstance(obj, dict):
         return {k: _substitute_env_vars(v) for k, v in obj.items()}
     elif isinstance(obj, list):
@@ -61,10 +110,41 @@ def get_enabled_services(config: dict[str, Any], service_type: str) -> list[dict
     Returns:
         List of enabled service configurations.
     """
-    services = config.get("services", {}).get(service_type, [])
+    enabled = config.get("_enabled", {})
+    if service_type in enabled:
+        return enabled[service_type]
+    return _filter_enabled(config, service_type)
+
+
+def _filter_enabled(config: dict[str, Any], service_type: str) -> list[dict[str, Any]]:
+    """Filter the configured services of a type down to enabled ones."""
+    services = (config.get("services") or {}).get(service_type) or []
     return [s for s in services if s.get("enabled", False)]
 
 
+def get_service_headers(service_config: dict[str, Any]) -> dict[str, str]:
+    """Get the HTTP headers for requests to a service.
+    
+    Args:
+        service_config: Service configuration.
+    
+    Returns:
+        Headers with the service's bearer token and JSON content type.
+    """
+    headers = service_config.get("_headers")
+    if headers is None:
+        headers = _build_headers(service_config)
+    return headers
+
+
+def _build_headers(service_config: dict[str, Any]) -> dict[str, str]:
+    """Build the HTTP headers for requests to a service."""
+    return {
+        "Authorization": f"Bearer {service_config.get('api_key', '')}",
+        "Content-Type": "application/json"
+    }
+
+
 def get_openai_config(config: dict[str, Any]) -> dict[str, str]:
     """Get OpenAI configuration.
     
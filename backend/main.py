@@ -1,23 +1,61 @@
 """FastAPI application with /check and /rephrase endpoints."""
-import io
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+import httpx
+import orjson
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
-from backend.config import get_enabled_services, get_openai_config, load_config
+from backend.config import (
+    DEFAULT_SERVICE_TIMEOUT,
+    get_enabled_services,
+    get_openai_config,
+    load_config,
+)
 from backend.models import CheckResponse, RephraseResponse, ServiceResult
 from backend.services.ai_detector import detect_all_ai_services
+from backend.services.openai_client import close_openai_clients
 from backend.services.plagiarism import check_all_plagiarism_services
 from backend.services.rephraser import rephrase_with_first_enabled
-from backend.services.summarizer import generate_summary
+from backend.services.summarizer import generate_summary, stream_summary
+from backend.utils.cache import RedisCache, TTLCache, text_cache_key
 from backend.utils.pdf_parser import extract_text_from_pdf
 
+# Check results for recently submitted texts, so re-checks skip the services
+_check_cache = TTLCache(maxsize=256, ttl=300.0)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage clients shared across requests."""
+    app.state.http = httpx.AsyncClient(
+        timeout=DEFAULT_SERVICE_TIMEOUT,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True
+    )
+    # Optional cache shared by all workers, enabled by setting REDIS_URL
+    redis_url = os.getenv("REDIS_URL")
+    app.state.shared_cache = RedisCache(redis_url) if redis_url else None
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+        await close_openai_clients()
+        if app.state.shared_cache is not None:
+            await app.state.shared_cache.close()
+
+
 app = FastAPI(
     title="Plagiarism Checker API",
     description="API for plagiarism checking, AI content detection, and text rephrasing",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend communication
@@ -41,6 +79,7 @@ async def root():
 
 @app.post("/check", response_model=CheckResponse)
 async def check_text(
+    request: Request,
     text: str | None = Form(None),
     file: UploadFile | None = File(None)
 ) -> CheckResponse:
@@ -59,24 +98,7 @@ async def check_text(
     Raises:
         HTTPException: If no text or file is provided, or if text extraction fails.
     """
-    # Extract text from PDF if file is provided
-    if file is not None:
-        if not file.filename or not file.filename.lower().endswith(".pdf"):
-            raise HTTPException(
-                status_code=400,
-                detail="Only PDF files are supported"
-            )
-        try:
-            content = await file.read()
-            text = extract_text_from_pdf(io.BytesIO(content))
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-    
-    if not text or not text.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="No text provided. Please provide text or upload a PDF file."
-        )
+    text = await _get_submitted_text(text, file)
     
     # Load configuration
     try:
@@ -84,22 +106,8 @@ async def check_text(
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    # Get enabled services
-    plagiarism_services = get_enabled_services(config, "plagiarism_checkers")
-    ai_detector_services = get_enabled_services(config, "ai_detectors")
-    openai_config = get_openai_config(config)
-    
-    # Run all checks
-    plagiarism_results = await check_all_plagiarism_services(text, plagiarism_services)
-    ai_detection_results = await detect_all_ai_services(text, ai_detector_services)
-    
-    # Generate summary
-    summary = await generate_summary(
-        text=text,
-        plagiarism_results=plagiarism_results,
-        ai_detection_results=ai_detection_results,
-        openai_api_key=openai_config["api_key"],
-        openai_model=openai_config["model"]
+    plagiarism_results, ai_detection_results, summary = await _run_checks(
+        text, config, request.app.state.http, request.app.state.shared_cache
     )
     
     return CheckResponse(
@@ -110,8 +118,88 @@ async def check_text(
     )
 
 
+@app.post("/check/stream")
+async def check_text_stream(
+    request: Request,
+    text: str | None = Form(None),
+    file: UploadFile | None = File(None)
+) -> StreamingResponse:
+    """Check text like /check, streaming the summary as it is generated.
+    
+    The response is newline-delimited JSON. The first line carries the
+    service results, each following "summary" line carries the next piece
+    of the summary, and a final "done" line ends the stream.
+    
+    Args:
+        text: Text content to check (optional if file is provided).
+        file: PDF file to extract text from (optional if text is provided).
+    
+    Returns:
+        StreamingResponse of newline-delimited JSON events.
+    
+    Raises:
+        HTTPException: If no text or file is provided, or if text extraction fails.
+    """
+    text = await _get_submitted_text(text, file)
+    
+    # Load configuration
+    try:
+        config = load_config()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    shared_cache = request.app.state.shared_cache
+    cached = await _get_cached_checks(text, config, shared_cache)
+    if cached is not None:
+        plagiarism_results, ai_detection_results, summary = cached
+    else:
+        plagiarism_results, ai_detection_results = await _run_services(
+            text, config, request.app.state.http
+        )
+        summary = None
+    
+    async def events():
+        yield _ndjson_line({
+            "type": "results",
+            "plagiarism_results": [r.model_dump() for r in plagiarism_results],
+            "ai_detection_results": [r.model_dump() for r in ai_detection_results],
+            "original_text": text
+        })
+        
+        if summary is not None:
+            yield _ndjson_line({"type": "summary", "text": summary})
+        else:
+            openai_config = get_openai_config(config)
+            summary_parts = []
+            summary_ok = True
+            async for chunk, chunk_ok in stream_summary(
+                text=text,
+                plagiarism_results=plagiarism_results,
+                ai_detection_results=ai_detection_results,
+                openai_api_key=openai_config["api_key"],
+                openai_model=openai_config["model"]
+            ):
+                summary_parts.append(chunk)
+                summary_ok = summary_ok and chunk_ok
+                yield _ndjson_line({"type": "summary", "text": chunk})
+            
+            # Partial or fallback summaries are not cached so they get retried
+            if summary_ok:
+                await _store_checks(
+                    text,
+                    config,
+                    (plagiarism_results, ai_detection_results, "".join(summary_parts)),
+                    shared_cache
+                )
+        
+        yield _ndjson_line({"type": "done"})
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @app.post("/rephrase", response_model=RephraseResponse)
 async def rephrase_text(
+    request: Request,
     text: str = Form(...)
 ) -> RephraseResponse:
     """Rephrase text and run all checks on the improved version.
@@ -140,15 +228,12 @@ async def rephrase_text(
     except FileNotFoundError as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-    # Get enabled services
     rephrasing_services = get_enabled_services(config, "rephrasing")
-    plagiarism_services = get_enabled_services(config, "plagiarism_checkers")
-    ai_detector_services = get_enabled_services(config, "ai_detectors")
-    openai_config = get_openai_config(config)
+    http_client = request.app.state.http
     
     # Rephrase the text
     rephrased_text, rephrase_result = await rephrase_with_first_enabled(
-        text, rephrasing_services
+        text, rephrasing_services, http_client
     )
     
     if not rephrase_result.success:
@@ -164,16 +249,8 @@ async def rephrase_text(
         )
     
     # Run all checks on rephrased text
-    plagiarism_results = await check_all_plagiarism_services(rephrased_text, plagiarism_services)
-    ai_detection_results = await detect_all_ai_services(rephrased_text, ai_detector_services)
-    
-    # Generate summary for rephrased text
-    summary = await generate_summary(
-        text=rephrased_text,
-        plagiarism_results=plagiarism_results,
-        ai_detection_results=ai_detection_results,
-        openai_api_key=openai_config["api_key"],
-        openai_model=openai_config["model"]
+    plagiarism_results, ai_detection_results, summary = await _run_checks(
+        rephrased_text, config, http_client, request.app.state.shared_cache
     )
     
     return RephraseResponse(
@@ -185,6 +262,205 @@ async def rephrase_text(
     )
 
 
+async def _get_submitted_text(text: str | None, file: UploadFile | None) -> str:
+    """Get the text to check from the form text or an uploaded PDF.
+    
+    Args:
+        text: Text content from the form (optional if file is provided).
+        file: Uploaded PDF file (optional if text is provided).
+    
+    Returns:
+        Text content to check.
+    
+    Raises:
+        HTTPException: If no text or file is provided, or if text extraction fails.
+    """
+    # Extract text from PDF if file is provided
+    if file is not None:
+        if not file.filename or not file.filename.lower().endswith(".pdf"):
+            raise HTTPException(
+                status_code=400,
+                detail="Only PDF files are supported"
+            )
+        try:
+            content = await file.read()
+            text = await extract_text_from_pdf(content)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    if not text or not text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="No text provided. Please provide text or upload a PDF file."
+        )
+    
+    return text
+
+
+async def _run_checks(
+    text: str,
+    config: dict[str, Any],
+    http_client: httpx.AsyncClient,
+    shared_cache: RedisCache | None = None
+) -> tuple[list[ServiceResult], list[ServiceResult], str]:
+    """Run plagiarism and AI detection on text and summarize the results.
+    
+    Results are cached by text for a few minutes in this process, and
+    longer in the shared cache when one is configured. Only runs where
+    every service and the OpenAI summary succeeded are cached, so
+    transient failures are retried.
+    
+    Args:
+        text: Text content to check.
+        config: Loaded configuration.
+        http_client: Shared HTTP client for service calls.
+        shared_cache: Optional cache shared with other workers.
+    
+    Returns:
+        Tuple of (plagiarism_results, ai_detection_results, summary).
+    """
+    cached = await _get_cached_checks(text, config, shared_cache)
+    if cached is not None:
+        return cached
+    
+    plagiarism_results, ai_detection_results = await _run_services(
+        text, config, http_client
+    )
+    
+    # Generate summary
+    openai_config = get_openai_config(config)
+    summary, summary_ok = await generate_summary(
+        text=text,
+        plagiarism_results=plagiarism_results,
+        ai_detection_results=ai_detection_results,
+        openai_api_key=openai_config["api_key"],
+        openai_model=openai_config["model"]
+    )
+    
+    checks = (plagiarism_results, ai_detection_results, summary)
+    if summary_ok:
+        await _store_checks(text, config, checks, shared_cache)
+    return checks
+
+
+async def _run_services(
+    text: str,
+    config: dict[str, Any],
+    http_client: httpx.AsyncClient
+) -> tuple[list[ServiceResult], list[ServiceResult]]:
+    """Run all enabled plagiarism and AI detection services concurrently.
+    
+    Args:
+        text: Text content to check.
+        config: Loaded configuration.
+        http_client: Shared HTTP client for service calls.
+    
+    Returns:
+        Tuple of (plagiarism_results, ai_detection_results).
+    """
+    plagiarism_services = get_enabled_services(config, "plagiarism_checkers")
+    ai_detector_services = get_enabled_services(config, "ai_detectors")
+    
+    plagiarism_results, ai_detection_results = await asyncio.gather(
+        check_all_plagiarism_services(text, plagiarism_services, http_client),
+        detect_all_ai_services(text, ai_detector_services, http_client)
+    )
+    return plagiarism_results, ai_detection_results
+
+
+async def _get_cached_checks(
+    text: str,
+    config: dict[str, Any],
+    shared_cache: RedisCache | None
+) -> tuple[list[ServiceResult], list[ServiceResult], str] | None:
+    """Look up cached check results for text.
+    
+    Args:
+        text: Text content that was checked.
+        config: Loaded configuration.
+        shared_cache: Optional cache shared with other workers.
+    
+    Returns:
+        Tuple of (plagiarism_results, ai_detection_results, summary), or
+        None if the text has no cached results.
+    """
+    cache_key = text_cache_key(text)
+    cached = _check_cache.get(cache_key)
+    # The entry keeps a reference to its config, so an identity check
+    # reliably detects a config reload since the results were stored
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    
+    if shared_cache is not None:
+        payload = await shared_cache.get(_shared_cache_key(config, cache_key))
+        if payload is not None:
+            try:
+                checks = _decode_checks(payload)
+            except (ValueError, KeyError, TypeError):
+                # Corrupt or outdated entry (JSON and validation errors are
+                # ValueErrors); recompute and overwrite it
+                checks = None
+            if checks is not None:
+                _check_cache.set(cache_key, (config, checks))
+                return checks
+    
+    return None
+
+
+async def _store_checks(
+    text: str,
+    config: dict[str, Any],
+    checks: tuple[list[ServiceResult], list[ServiceResult], str],
+    shared_cache: RedisCache | None
+) -> None:
+    """Cache check results if every service succeeded.
+    
+    Args:
+        text: Text content that was checked.
+        config: Loaded configuration.
+        checks: Tuple of (plagiarism_results, ai_detection_results, summary).
+        shared_cache: Optional cache shared with other workers.
+    """
+    plagiarism_results, ai_detection_results, _ = checks
+    if not all(r.success for r in plagiarism_results + ai_detection_results):
+        return
+    
+    cache_key = text_cache_key(text)
+    _check_cache.set(cache_key, (config, checks))
+    if shared_cache is not None:
+        await shared_cache.set(_shared_cache_key(config, cache_key), _encode_checks(checks))
+
+
+def _shared_cache_key(config: dict[str, Any], cache_key: str) -> str:
+    """Scope a text cache key to the config version it was computed with."""
+    return f"{config.get('_version', '')}:{cache_key}"
+
+
+def _ndjson_line(event: dict[str, Any]) -> bytes:
+    """Encode one event of a newline-delimited JSON stream."""
+    return orjson.dumps(event) + b"\n"
+
+
+def _encode_checks(checks: tuple[list[ServiceResult], list[ServiceResult], str]) -> bytes:
+    """Serialize check results for the shared cache."""
+    plagiarism_results, ai_detection_results, summary = checks
+    return orjson.dumps({
+        "plagiarism_results": [r.model_dump() for r in plagiarism_results],
+        "ai_detection_results": [r.model_dump() for r in ai_detection_results],
+        "summary": summary
+    })
+
+
+def _decode_checks(payload: bytes) -> tuple[list[ServiceResult], list[ServiceResult], str]:
+    """Deserialize check results stored by _encode_checks."""
+    data = orjson.loads(payload)
+    return (
+        [ServiceResult.model_validate(r) for r in data["plagiarism_results"]],
+        [ServiceResult.model_validate(r) for r in data["ai_detection_results"]],
+        data["summary"]
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -193,4 +469,9 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count() or 1
+    )
@@ -1,16 +1,20 @@
 """Pydantic models for API requests and responses."""
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CheckRequest(BaseModel):
     """Request model for the /check endpoint."""
+    model_config = ConfigDict(extra="ignore")
+    
     text: str = Field(..., min_length=1, description="Text content to check")
 
 
 class ServiceResult(BaseModel):
     """Result from a single external service."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     service_name: str = Field(..., description="Name of the service")
     service_type: str = Field(..., description="Type of service (plagiarism, ai_detection, rephrasing)")
     success: bool = Field(..., description="Whether the service call was successful")
@@ -20,6 +24,8 @@ class ServiceResult(BaseModel):
 
 class CheckResponse(BaseModel):
     """Response model for the /check endpoint."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     summary: str = Field(..., description="Human-friendly summary of all results")
     plagiarism_results: list[ServiceResult] = Field(default_factory=list, description="Results from plagiarism checkers")
     ai_detection_results: list[ServiceResult] = Field(default_factory=list, description="Results from AI detectors")
@@ -28,11 +34,15 @@ class CheckResponse(BaseModel):
 
 class RephraseRequest(BaseModel):
     """Request model for the /rephrase endpoint."""
+    model_config = ConfigDict(extra="ignore")
+    
     text: str = Field(..., min_length=1, description="Text content to rephrase")
 
 
 class RephraseResponse(BaseModel):
     """Response model for the /rephrase endpoint."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     summary: str = Field(..., description="Human-friendly summary of results for rephrased text")
     rephrased_text: str = Field(..., description="The rephrased version of the text")
     plagiarism_results: list[ServiceResult] = Field(default_factory=list, description="Results from plagiarism checkers")
@@ -1,44 +1,50 @@
 """AI content detection service caller."""
+import asyncio
 from typing import Any
 
 import httpx
+import orjson
 
+from backend.config import DEFAULT_SERVICE_TIMEOUT, get_service_headers
 from backend.models import ServiceResult
 
 
-async def detect_ai_content(text: str, service_config: dict[str, Any]) -> ServiceResult:
+async def detect_ai_content(
+    text: str,
+    service_config: dict[str, Any],
+    client: httpx.AsyncClient
+) -> ServiceResult:
     """Detect AI-generated content using an external service.
     
     Args:
         text: Text content to analyze.
-        service_config: Service configuration with name, api_url, api_key.
+        service_config: Service configuration with name, api_url, api_key
+            and optional timeout_s.
+        client: Shared HTTP client used for the request.
     
     Returns:
         ServiceResult with AI detection results.
     """
     service_name = service_config.get("name", "Unknown Service")
     api_url = service_config.get("api_url", "")
-    api_key = service_config.get("api_key", "")
+    timeout = service_config.get("timeout_s", DEFAULT_SERVICE_TIMEOUT)
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                api_url,
-                json={"text": text},
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            response.raise_for_status()
-            result_data = response.json()
-            
-            return ServiceResult(
-                service_name=service_name,
-                service_type="ai_detection",
-                success=True,
-                result=result_data
-            )
+        response = await client.post(
+            api_url,
+            content=orjson.dumps({"text": text}),
+            headers=get_service_headers(service_config),
+            timeout=timeout
+        )
+        response.raise_for_status()
+        result_data = orjson.loads(response.content)
+        
+        return ServiceResult(
+            service_name=service_name,
+            service_type="ai_detection",
+            success=True,
+            result=result_data
+        )
     
     except httpx.TimeoutException:
         return ServiceResult(
@@ -65,19 +71,19 @@ async def detect_ai_content(text: str, service_config: dict[str, Any]) -> Servic
 
 async def detect_all_ai_services(
     text: str, 
-    services: list[dict[str, Any]]
+    services: list[dict[str, Any]],
+    client: httpx.AsyncClient
 ) -> list[ServiceResult]:
     """Detect AI content using all enabled detection services.
     
     Args:
         text: Text content to analyze.
         services: List of enabled AI detection service configurations.
+        client: Shared HTTP client used for all service calls.
     
     Returns:
-        List of ServiceResult from all services.
+        List of ServiceResult from all services, in the same order as services.
     """
-    results = []
-    for service in services:
-        result = await detect_ai_content(text, service)
-        results.append(result)
-    return results
+    # Run detectors concurrently; failures come back as unsuccessful results
+    results = await asyncio.gather(*(detect_ai_content(text, service, client) for service in services))
+    return list(results)
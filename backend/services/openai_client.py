@@ -0,0 +1,37 @@
+"""Shared OpenAI client instances."""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+_clients: dict[str, "AsyncOpenAI"] = {}
+
+
+def get_openai_client(api_key: str) -> "AsyncOpenAI":
+    """Get a cached OpenAI client for the given API key.
+    
+    Reusing the client keeps its connection pool to the OpenAI API alive
+    between requests.
+    
+    Args:
+        api_key: OpenAI API key.
+    
+    Returns:
+        AsyncOpenAI client bound to the API key.
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        # Imported on first use to keep the openai package out of cold start
+        from openai import AsyncOpenAI
+        
+        client = AsyncOpenAI(api_key=api_key)
+        _clients[api_key] = client
+    return client
+
+
+async def close_openai_clients() -> None:
+    """Close all cached OpenAI clients."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
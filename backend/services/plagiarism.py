@@ -1,44 +1,50 @@
 """Plagiarism checking service caller."""
+import asyncio
 from typing import Any
 
 import httpx
+import orjson
 
+from backend.config import DEFAULT_SERVICE_TIMEOUT, get_service_headers
 from backend.models import ServiceResult
 
 
-async def check_plagiarism(text: str, service_config: dict[str, Any]) -> ServiceResult:
+async def check_plagiarism(
+    text: str,
+    service_config: dict[str, Any],
+    client: httpx.AsyncClient
+) -> ServiceResult:
     """Check text for plagiarism using an external service.
     
     Args:
         text: Text content to check.
-        service_config: Service configuration with name, api_url, api_key.
+        service_config: Service configuration with name, api_url, api_key
+            and optional timeout_s.
+        client: Shared HTTP client used for the request.
     
     Returns:
         ServiceResult with plagiarism check results.
     """
     service_name = service_config.get("name", "Unknown Service")
     api_url = service_config.get("api_url", "")
-    api_key = service_config.get("api_key", "")
+    timeout = service_config.get("timeout_s", DEFAULT_SERVICE_TIMEOUT)
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                api_url,
-                json={"text": text},
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            response.raise_for_status()
-            result_data = response.json()
-            
-            return ServiceResult(
-                service_name=service_name,
-                service_type="plagiarism",
-                success=True,
-                result=result_data
-            )
+        response = await client.post(
+            api_url,
+            content=orjson.dumps({"text": text}),
+            headers=get_service_headers(service_config),
+            timeout=timeout
+        )
+        response.raise_for_status()
+        result_data = orjson.loads(response.content)
+        
+        return ServiceResult(
+            service_name=service_name,
+            service_type="plagiarism",
+            success=True,
+            result=result_data
+        )
     
     except httpx.TimeoutException:
         return ServiceResult(
@@ -65,19 +71,20 @@ async def check_plagiarism(text: str, service_config: dict[str, Any]) -> Service
 
 async def check_all_plagiarism_services(
     text: str, 
-    services: list[dict[str, Any]]
+    services: list[dict[str, Any]],
+    client: httpx.AsyncClient
 ) -> list[ServiceResult]:
     """Check text against all enabled plagiarism services.
     
     Args:
         text: Text content to check.
         services: List of enabled plagiarism service configurations.
+        client: Shared HTTP client used for all service calls.
     
     Returns:
-        List of ServiceResult from all services.
+        List of ServiceResult from all services, in the same order as services.
     """
-    results = []
-    for service in services:
-        result = await check_plagiarism(text, service)
-        results.append(result)
-    return results
+    # Service calls are independent, so run them concurrently. Each call
+    # converts its own failures into a ServiceResult, so gather never raises.
+    results = await asyncio.gather(*(check_plagiarism(text, service, client) for service in services))
+    return list(results)
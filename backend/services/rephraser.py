@@ -1,25 +1,33 @@
 """Text rephrasing service caller."""
+import asyncio
 import os
 from typing import Any
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
 
+from backend.config import DEFAULT_OPENAI_TIMEOUT, DEFAULT_SERVICE_TIMEOUT, get_service_headers
 from backend.models import ServiceResult
+from backend.services.openai_client import get_openai_client
 
 
-async def rephrase_text_with_openai(text: str, api_key: str) -> tuple[str, ServiceResult]:
+async def rephrase_text_with_openai(
+    text: str,
+    api_key: str,
+    timeout: float = DEFAULT_OPENAI_TIMEOUT
+) -> tuple[str, ServiceResult]:
     """Rephrase text using OpenAI.
     
     Args:
         text: Text content to rephrase.
         api_key: OpenAI API key.
+        timeout: Request timeout in seconds.
     
     Returns:
         Tuple of (rephrased_text, ServiceResult).
     """
     try:
-        client = AsyncOpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         
         response = await client.chat.completions.create(
             model="gpt-4",
@@ -33,7 +41,8 @@ async def rephrase_text_with_openai(text: str, api_key: str) -> tuple[str, Servi
                     "content": text
                 }
             ],
-            temperature=0.7
+            temperature=0.7,
+            timeout=timeout
         )
         
         rephrased = response.choices[0].message.content or ""
@@ -56,13 +65,16 @@ async def rephrase_text_with_openai(text: str, api_key: str) -> tuple[str, Servi
 
 async def rephrase_text_with_service(
     text: str, 
-    service_config: dict[str, Any]
+    service_config: dict[str, Any],
+    client: httpx.AsyncClient
 ) -> tuple[str, ServiceResult]:
     """Rephrase text using an external service.
     
     Args:
         text: Text content to rephrase.
-        service_config: Service configuration with name, api_url, api_key.
+        service_config: Service configuration with name, api_url, api_key
+            and optional timeout_s.
+        client: Shared HTTP client used for the request.
     
     Returns:
         Tuple of (rephrased_text, ServiceResult).
@@ -74,30 +86,30 @@ async def rephrase_text_with_service(
     # If api_url is "openai", use OpenAI rephrasing
     if api_url == "openai":
         openai_key = api_key or os.getenv("OPENAI_API_KEY", "")
-        return await rephrase_text_with_openai(text, openai_key)
+        timeout = service_config.get("timeout_s", DEFAULT_OPENAI_TIMEOUT)
+        return await rephrase_text_with_openai(text, openai_key, timeout)
+    
+    timeout = service_config.get("timeout_s", DEFAULT_SERVICE_TIMEOUT)
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                api_url,
-                json={"text": text},
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            response.raise_for_status()
-            result_data = response.json()
-            
-            # Extract rephrased text from response
-            rephrased = result_data.get("rephrased_text", result_data.get("text", ""))
-            
-            return rephrased, ServiceResult(
-                service_name=service_name,
-                service_type="rephrasing",
-                success=True,
-                result=result_data
-            )
+        response = await client.post(
+            api_url,
+            content=orjson.dumps({"text": text}),
+            headers=get_service_headers(service_config),
+            timeout=timeout
+        )
+        response.raise_for_status()
+        result_data = orjson.loads(response.content)
+        
+        # Extract rephrased text from response
+        rephrased = result_data.get("rephrased_text", result_data.get("text", ""))
+        
+        return rephrased, ServiceResult(
+            service_name=service_name,
+            service_type="rephrasing",
+            success=True,
+            result=result_data
+        )
     
     except httpx.TimeoutException:
         return "", ServiceResult(
@@ -124,13 +136,19 @@ async def rephrase_text_with_service(
 
 async def rephrase_with_first_enabled(
     text: str, 
-    services: list[dict[str, Any]]
+    services: list[dict[str, Any]],
+    client: httpx.AsyncClient
 ) -> tuple[str, ServiceResult]:
-    """Rephrase text using the first enabled rephrasing service.
+    """Rephrase text using the first enabled service to succeed.
+    
+    All services are called concurrently so a slow or hung service does not
+    delay the others. The first successful result wins and the remaining
+    calls are cancelled.
     
     Args:
         text: Text content to rephrase.
         services: List of enabled rephrasing service configurations.
+        client: Shared HTTP client used for service calls.
     
     Returns:
         Tuple of (rephrased_text, ServiceResult).
@@ -143,13 +161,22 @@ async def rephrase_with_first_enabled(
             error="No rephrasing services enabled"
         )
     
-    # Try each service until one succeeds
+    pending = {
+        asyncio.create_task(rephrase_text_with_service(text, service, client))
+        for service in services
+    }
     last_result = None
-    for service in services:
-        rephrased, result = await rephrase_text_with_service(text, service)
-        last_result = result
-        if result.success:
-            return rephrased, result
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                rephrased, result = task.result()
+                last_result = result
+                if result.success:
+                    return rephrased, result
+    finally:
+        for task in pending:
+            task.cancel()
     
     # All services failed, return the last error
     if last_result is not None:
@@ -1,9 +1,15 @@
 """OpenAI summary generation service."""
+import io
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-from openai import AsyncOpenAI
-
 from backend.models import ServiceResult
+from backend.services.openai_client import get_openai_client
+
+# Limits on what is sent to OpenAI, to bound prompt size, latency and cost
+MAX_RESULT_CHARS = 2048
+MAX_CONTEXT_CHARS = 24000
 
 
 async def generate_summary(
@@ -12,7 +18,7 @@ async def generate_summary(
     ai_detection_results: list[ServiceResult],
     openai_api_key: str,
     openai_model: str = "gpt-4"
-) -> str:
+) -> tuple[str, bool]:
     """Generate a human-friendly summary of check results using OpenAI.
     
     Args:
@@ -23,46 +29,158 @@ async def generate_summary(
         openai_model: OpenAI model to use.
     
     Returns:
-        Human-friendly summary string.
+        Tuple of (summary, ok). ok is False when the OpenAI call failed or
+        returned nothing and the summary is a fallback standing in for it.
     """
-    if not openai_api_key:
-        return _generate_fallback_summary(plagiarism_results, ai_detection_results)
+    context, fallback = _prepare_summary(
+        text, plagiarism_results, ai_detection_results, openai_api_key
+    )
+    if context is None:
+        return fallback, True
     
     try:
-        client = AsyncOpenAI(api_key=openai_api_key)
-        
-        # Prepare context for OpenAI
-        context = _prepare_results_context(text, plagiarism_results, ai_detection_results)
+        client = get_openai_client(openai_api_key)
         
         response = await client.chat.completions.create(
             model=openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert at analyzing plagiarism and AI detection results. 
-                    Generate a clear, helpful summary for the user. Include:
-                    1. How much plagiarism was found (percentage if available)
-                    2. How much AI-generated content was detected
-                    3. Which parts look suspicious (if identifiable)
-                    4. What the user should do next (clear recommendations)
-                    
-                    Be concise but thorough. Use a friendly, helpful tone."""
-                },
-                {
-                    "role": "user",
-                    "content": context
-                }
-            ],
+            messages=_summary_messages(context),
             temperature=0.5
         )
         
-        return response.choices[0].message.content or _generate_fallback_summary(
-            plagiarism_results, ai_detection_results
-        )
+        summary = response.choices[0].message.content
+        if not summary:
+            return _generate_fallback_summary(plagiarism_results, ai_detection_results), False
+        return summary, True
     
     except Exception as e:
         # Fallback to basic summary if OpenAI fails
-        return _generate_fallback_summary(plagiarism_results, ai_detection_results, str(e))
+        return _generate_fallback_summary(plagiarism_results, ai_detection_results, str(e)), False
+
+
+async def stream_summary(
+    text: str,
+    plagiarism_results: list[ServiceResult],
+    ai_detection_results: list[ServiceResult],
+    openai_api_key: str,
+    openai_model: str = "gpt-4"
+) -> AsyncIterator[tuple[str, bool]]:
+    """Generate a summary like generate_summary, yielding it as it is written.
+    
+    Args:
+        text: The original text that was checked.
+        plagiarism_results: Results from plagiarism checking services.
+        ai_detection_results: Results from AI detection services.
+        openai_api_key: OpenAI API key.
+        openai_model: OpenAI model to use.
+    
+    Yields:
+        Tuples of (text, ok) holding consecutive pieces of the summary. ok is
+        False for pieces that stand in for a failed or empty OpenAI response.
+    """
+    context, fallback = _prepare_summary(
+        text, plagiarism_results, ai_detection_results, openai_api_key
+    )
+    if context is None:
+        yield fallback, True
+        return
+    
+    produced = False
+    try:
+        client = get_openai_client(openai_api_key)
+        
+        stream = await client.chat.completions.create(
+            model=openai_model,
+            messages=_summary_messages(context),
+            temperature=0.5,
+            stream=True
+        )
+        
+        # Close the response even if the consumer stops early, so a client
+        # disconnect doesn't leave the connection checked out of the pool
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    produced = True
+                    yield delta, True
+        finally:
+            await stream.close()
+    
+    except Exception as e:
+        if produced:
+            yield f"\n\n*Note: AI summary generation was interrupted: {e}*\n", False
+        else:
+            yield _generate_fallback_summary(plagiarism_results, ai_detection_results, str(e)), False
+        return
+    
+    if not produced:
+        yield _generate_fallback_summary(plagiarism_results, ai_detection_results), False
+
+
+def _prepare_summary(
+    text: str,
+    plagiarism_results: list[ServiceResult],
+    ai_detection_results: list[ServiceResult],
+    openai_api_key: str
+) -> tuple[str | None, str]:
+    """Build the OpenAI context, or decide that OpenAI should be skipped.
+    
+    Args:
+        text: The original text that was checked.
+        plagiarism_results: Results from plagiarism checking services.
+        ai_detection_results: Results from AI detection services.
+        openai_api_key: OpenAI API key.
+    
+    Returns:
+        Tuple of (context, fallback). Context is None when OpenAI should not
+        be called, in which case fallback holds the summary to use instead.
+    """
+    if not openai_api_key:
+        return None, _generate_fallback_summary(plagiarism_results, ai_detection_results)
+    
+    # Nothing to summarize if no service returned results
+    if not any(r.success for r in plagiarism_results + ai_detection_results):
+        return None, _generate_fallback_summary(plagiarism_results, ai_detection_results)
+    
+    context = _prepare_results_context(text, plagiarism_results, ai_detection_results)
+    if len(context) > MAX_CONTEXT_CHARS:
+        return None, _generate_fallback_summary(
+            plagiarism_results,
+            ai_detection_results,
+            "Service results were too large to summarize"
+        )
+    
+    return context, ""
+
+
+def _summary_messages(context: str) -> list[dict[str, str]]:
+    """Build the chat messages for a summary request.
+    
+    Args:
+        context: Formatted results context.
+    
+    Returns:
+        Messages for the chat completions API.
+    """
+    return [
+        {
+            "role": "system",
+            "content": """You are an expert at analyzing plagiarism and AI detection results. 
+            Generate a clear, helpful summary for the user. Include:
+            1. How much plagiarism was found (percentage if available)
+            2. How much AI-generated content was detected
+            3. Which parts look suspicious (if identifiable)
+            4. What the user should do next (clear recommendations)
+            
+            Be concise but thorough. Use a friendly, helpful tone."""
+        },
+        {
+            "role": "user",
+            "content": context
+        }
+    ]
 
 
 def _prepare_results_context(
@@ -80,31 +198,42 @@ def _prepare_results_context(
     Returns:
         Formatted context string.
     """
-    context_parts = [
-        f"Text being analyzed (first 500 chars): {text[:500]}...\n\n"
-    ]
+    buf = io.StringIO()
+    buf.write(f"Text being analyzed (first 500 chars): {text[:500]}...\n\n")
     
-    context_parts.append("PLAGIARISM CHECK RESULTS:\n")
+    buf.write("PLAGIARISM CHECK RESULTS:\n")
     if plagiarism_results:
         for result in plagiarism_results:
-            if result.success:
-                context_parts.append(f"- {result.service_name}: {result.result}\n")
-            else:
-                context_parts.append(f"- {result.service_name}: Error - {result.error}\n")
+            _write_result_line(buf, result)
     else:
-        context_parts.append("- No plagiarism checkers were enabled or available.\n")
+        buf.write("- No plagiarism checkers were enabled or available.\n")
     
-    context_parts.append("\nAI DETECTION RESULTS:\n")
+    buf.write("\nAI DETECTION RESULTS:\n")
     if ai_detection_results:
         for result in ai_detection_results:
-            if result.success:
-                context_parts.append(f"- {result.service_name}: {result.result}\n")
-            else:
-                context_parts.append(f"- {result.service_name}: Error - {result.error}\n")
+            _write_result_line(buf, result)
     else:
-        context_parts.append("- No AI detectors were enabled or available.\n")
+        buf.write("- No AI detectors were enabled or available.\n")
+    
+    return buf.getvalue()
+
+
+def _write_result_line(buf: io.StringIO, result: ServiceResult) -> None:
+    """Write one service result as a context line.
     
-    return "".join(context_parts)
+    Result payloads longer than MAX_RESULT_CHARS are truncated.
+    
+    Args:
+        buf: Buffer to write to.
+        result: Service result to describe.
+    """
+    if result.success:
+        serialized = json.dumps(result.result, default=str)
+        if len(serialized) > MAX_RESULT_CHARS:
+            serialized = serialized[:MAX_RESULT_CHARS] + "... [truncated]"
+        buf.write(f"- {result.service_name}: {serialized}\n")
+    else:
+        buf.write(f"- {result.service_name}: Error - {result.error}\n")
 
 
 def _generate_fallback_summary(
@@ -122,42 +251,43 @@ def _generate_fallback_summary(
     Returns:
         Basic summary string.
     """
-    parts = ["## Analysis Summary\n\n"]
+    buf = io.StringIO()
+    buf.write("## Analysis Summary\n\n")
     
     if error:
-        parts.append(f"*Note: AI summary generation encountered an issue: {error}*\n\n")
+        buf.write(f"*Note: AI summary generation encountered an issue: {error}*\n\n")
     
     # Plagiarism results
-    parts.append("### Plagiarism Check\n")
+    buf.write("### Plagiarism Check\n")
     if plagiarism_results:
         successful = [r for r in plagiarism_results if r.success]
         failed = [r for r in plagiarism_results if not r.success]
         
         if successful:
             for result in successful:
-                parts.append(f"- **{result.service_name}**: Check completed\n")
+                buf.write(f"- **{result.service_name}**: Check completed\n")
         if failed:
             for result in failed:
-                parts.append(f"- **{result.service_name}**: {result.error}\n")
+                buf.write(f"- **{result.service_name}**: {result.error}\n")
     else:
-        parts.append("No plagiarism checkers were enabled.\n")
+        buf.write("No plagiarism checkers were enabled.\n")
     
     # AI detection results
-    parts.append("\n### AI Content Detection\n")
+    buf.write("\n### AI Content Detection\n")
     if ai_detection_results:
         successful = [r for r in ai_detection_results if r.success]
         failed = [r for r in ai_detection_results if not r.success]
         
         if successful:
             for result in successful:
-                parts.append(f"- **{result.service_name}**: Detection completed\n")
+                buf.write(f"- **{result.service_name}**: Detection completed\n")
         if failed:
             for result in failed:
-                parts.append(f"- **{result.service_name}**: {result.error}\n")
+                buf.write(f"- **{result.service_name}**: {result.error}\n")
     else:
-        parts.append("No AI detectors were enabled.\n")
+        buf.write("No AI detectors were enabled.\n")
     
-    parts.append("\n### Recommendations\n")
-    parts.append("Review the detailed results from each service to understand the analysis findings.\n")
+    buf.write("\n### Recommendations\n")
+    buf.write("Review the detailed results from each service to understand the analysis findings.\n")
     
-    return "".join(parts)
+    return buf.getvalue()
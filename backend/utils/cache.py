@@ -0,0 +1,129 @@
+"""Result cache utilities."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+def text_cache_key(text: str) -> str:
+    """Build a compact cache key for a piece of text.
+    
+    Args:
+        text: Text content to hash.
+    
+    Returns:
+        Hex digest of the text.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed time.
+    
+    Not thread-safe; intended for use from a single event loop, where
+    get and set never yield.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """Create a cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Seconds before an entry expires.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: str) -> Any | None:
+        """Get a cached value.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            The cached value, or None if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+class RedisCache:
+    """Cache shared between worker processes, backed by Redis.
+    
+    Redis errors are treated as cache misses, so an unavailable Redis
+    server slows requests down but never fails them.
+    """
+    
+    def __init__(self, url: str, ttl: int = 3600, prefix: str = "check:"):
+        """Create a cache.
+        
+        Args:
+            url: Redis connection URL, e.g. redis://localhost:6379/0.
+            ttl: Seconds before an entry expires.
+            prefix: Prefix added to every key.
+        """
+        # Imported here so redis is only needed when a cache URL is configured
+        import redis.asyncio as redis
+        
+        self.ttl = ttl
+        self.prefix = prefix
+        # Short timeouts so a stalled Redis server counts as a miss
+        self._client = redis.from_url(
+            url,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25
+        )
+    
+    async def get(self, key: str) -> bytes | None:
+        """Get a cached value.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            The cached bytes, or None if missing or Redis is unavailable.
+        """
+        try:
+            return await self._client.get(self.prefix + key)
+        except Exception:
+            return None
+    
+    async def set(self, key: str, value: bytes) -> None:
+        """Store a value with the cache TTL.
+        
+        Args:
+            key: Cache key.
+            value: Serialized value to store.
+        """
+        try:
+            await self._client.setex(self.prefix + key, self.ttl, value)
+        except Exception:
+            pass
+    
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
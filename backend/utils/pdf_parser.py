@@ -1,15 +1,34 @@
 """PDF text extraction utility."""
-import io
-from typing import BinaryIO
+import asyncio
+import threading
 
-import pdfplumber
+# PDFium is not thread-safe, so only one worker thread may use it at a time
+_pdfium_lock = threading.Lock()
 
 
-def extract_text_from_pdf(pdf_file: BinaryIO) -> str:
+async def extract_text_from_pdf(pdf_data: bytes) -> str:
     """Extract text content from a PDF file.
     
+    Parsing is CPU-bound, so it runs in a worker thread to keep the event
+    loop free for other requests.
+    
+    Args:
+        pdf_data: Raw PDF file content.
+    
+    Returns:
+        Extracted text content from all pages.
+    
+    Raises:
+        ValueError: If the PDF cannot be parsed or contains no text.
+    """
+    return await asyncio.to_thread(_extract_text, pdf_data)
+
+
+def _extract_text(pdf_data: bytes) -> str:
+    """Extract text from all pages of a PDF synchronously.
+    
     Args:
-        pdf_file: Binary file object containing PDF data.
+        pdf_data: Raw PDF file content.
     
     Returns:
         Extracted text content from all pages.
@@ -17,18 +36,27 @@ def extract_text_from_pdf(pdf_file: BinaryIO) -> str:
     Raises:
         ValueError: If the PDF cannot be parsed or contains no text.
     """
+    # Imported lazily so workers that never see a PDF don't load PDFium
+    import pypdfium2 as pdfium
+    
     try:
-        # Read the file content into bytes
-        content = pdf_file.read()
-        pdf_bytes = io.BytesIO(content)
-        
         text_parts = []
         
-        with pdfplumber.open(pdf_bytes) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_data)
+            try:
+                for index in range(len(pdf)):
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+                    if page_text.strip():
+                        text_parts.append(page_text.replace("\r\n", "\n"))
+            finally:
+                pdf.close()
         
         if not text_parts:
             raise ValueError("No text content found in PDF")
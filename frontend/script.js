@@ -69,7 +69,7 @@ async function handleCheck() {
             formData.append('text', text);
         }
         
-        const response = await fetch('/check', {
+        const response = await fetch('/check/stream', {
             method: 'POST',
             body: formData
         });
@@ -79,11 +79,10 @@ async function handleCheck() {
             throw new Error(errorData.detail || 'Failed to check text');
         }
         
-        const data = await response.json();
+        const data = await readCheckStream(response);
         lastCheckResults = data;
         currentText = data.original_text;
         
-        displayResults(data);
         rephraseBtn.disabled = false;
         
     } catch (error) {
@@ -93,6 +92,56 @@ async function handleCheck() {
     }
 }
 
+/**
+ * Read a streamed check response, showing results and summary as they arrive
+ */
+async function readCheckStream(response) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let data = null;
+    let finished = false;
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        
+        for (const line of lines) {
+            if (!line.trim()) continue;
+            const event = JSON.parse(line);
+            
+            if (event.type === 'results') {
+                data = {
+                    summary: '',
+                    plagiarism_results: event.plagiarism_results,
+                    ai_detection_results: event.ai_detection_results,
+                    original_text: event.original_text
+                };
+                displayResults(data);
+                summaryContent.innerHTML = '<p>Generating summary...</p>';
+                hideLoading();
+            } else if (event.type === 'summary') {
+                data.summary += event.text;
+                summaryContent.innerHTML = formatSummary(data.summary);
+            } else if (event.type === 'done') {
+                finished = true;
+            }
+        }
+    }
+    
+    if (!data) {
+        throw new Error('Failed to check text');
+    }
+    if (!finished) {
+        throw new Error('The check was interrupted before the summary finished. Please try again.');
+    }
+    return data;
+}
+
 /**
  * Handle rephrase button click
  */